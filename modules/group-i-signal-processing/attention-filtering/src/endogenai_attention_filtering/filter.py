@@ -3,6 +3,7 @@ Attention & Filtering logic for the frankenbrAIn Attention Layer.
 
 AttentionFilter implements:
   - Salience scoring based on signal priority, modality, and type
+  - A scoring bypass for top-down control signals (always admitted)
   - Configurable salience threshold gating
   - Top-down attention directive injection (executive → sensory modulation)
   - Signal routing to appropriate downstream modules
@@ -15,46 +16,67 @@ Usage
 >>> result = af.evaluate(signal)
 >>> if result:
 ...     print(result.salience.score, result.routed_to)
+>>> results = af.evaluate_batch([signal_a, signal_b])
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import time
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 import structlog
 
-from endogenai_attention_filtering.imports import Signal
+from endogenai_attention_filtering.imports import Modality, Signal
 from endogenai_attention_filtering.models import (
     AttentionDirective,
     FilteredSignal,
     SalienceScore,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 log = structlog.get_logger(__name__)
 
-# Base salience weights by modality
-_MODALITY_BASE_WEIGHT: dict[str, float] = {
-    "text": 0.6,
-    "image": 0.5,
-    "audio": 0.5,
-    "sensor": 0.4,
-    "api-event": 0.7,
-    "internal": 0.3,
-    "control": 0.9,  # top-down control signals always prioritised
+# Base salience weights by modality.  Tables are keyed by Modality members so
+# lookups use signal.modality directly (a StrEnum hashes as its value) without
+# resolving .value per signal.  CONTROL has no weight: control signals bypass
+# scoring in _gate.
+_MODALITY_BASE_WEIGHT: dict[Modality, float] = {
+    Modality.TEXT: 0.6,
+    Modality.IMAGE: 0.5,
+    Modality.AUDIO: 0.5,
+    Modality.SENSOR: 0.4,
+    Modality.API_EVENT: 0.7,
+    Modality.INTERNAL: 0.3,
+}
+
+# Blended base salience per modality, indexed by priority 0–10:
+# base_weight × (0.5 + priority/10 × 0.5).  Priority is an integer in [0, 10],
+# so the per-signal arithmetic folds into a table lookup.
+_BASE_SALIENCE: dict[Modality, tuple[float, ...]] = {
+    modality: tuple(weight * (0.5 + (priority / 10.0) * 0.5) for priority in range(11))
+    for modality, weight in _MODALITY_BASE_WEIGHT.items()
 }
 
 # Downstream routing table: modality → module id
-_DEFAULT_ROUTING: dict[str, str] = {
-    "text": "perception",
-    "image": "perception",
-    "audio": "perception",
-    "sensor": "perception",
-    "api-event": "perception",
-    "internal": "perception",
-    "control": "executive",
+_DEFAULT_ROUTING: dict[Modality, str] = {
+    Modality.TEXT: "perception",
+    Modality.IMAGE: "perception",
+    Modality.AUDIO: "perception",
+    Modality.SENSOR: "perception",
+    Modality.API_EVENT: "perception",
+    Modality.INTERNAL: "perception",
+    Modality.CONTROL: "executive",
 }
 
+# Upper bound on memoised per-type boost multipliers; the cache is cleared
+# wholesale when exceeded so an unbounded stream of distinct types cannot grow it.
+_TYPE_BOOST_CACHE_MAX = 1024
+
 
 class AttentionFilter:
     """
@@ -67,18 +89,39 @@ class AttentionFilter:
         Signals below this threshold are discarded.
     module_id:
         Canonical module id for logging.
+    log_sample_rate:
+        Emit per-signal log events (gated out, TTL expired, passed) for one in
+        every ``log_sample_rate`` evaluated signals.  ``1`` (the default) logs
+        every signal; directive events are always logged.
     """
 
     def __init__(
         self,
         threshold: float = 0.3,
         module_id: str = "attention-filtering",
+        log_sample_rate: int = 1,
     ) -> None:
         if not 0.0 <= threshold <= 1.0:
             raise ValueError(f"threshold must be in [0, 1], got {threshold}")
+        if log_sample_rate < 1:
+            raise ValueError(f"log_sample_rate must be >= 1, got {log_sample_rate}")
         self._threshold = threshold
         self._module_id = module_id
+        self._log_sample_rate = log_sample_rate
+        self._evaluated = 0
         self._active_directives: list[_TimedDirective] = []
+        # Min-heap of (expires_at, seq, td) for directives with a TTL, so
+        # expiry checks only inspect the earliest deadline.
+        self._expiry_heap: list[tuple[float, int, _TimedDirective]] = []
+        self._seq = itertools.count()
+        # Combined multipliers across all active directives, keyed by modality
+        # and by type prefix respectively.
+        self._modality_boost: dict[str, float] = {}
+        self._type_boost: dict[str, float] = {}
+        self._type_boost_cache: dict[str, float] = {}
+        # Threshold override of the most recently applied active directive that
+        # sets one; None falls back to the configured threshold.
+        self._threshold_override: float | None = None
         self._logger = log.bind(module_id=module_id)
 
     # ------------------------------------------------------------------
@@ -92,9 +135,13 @@ class AttentionFilter:
         Directives bias salience scores for specific modalities or signal types
         and remain active until their TTL expires or they are replaced.
         """
-        self._active_directives.append(
-            _TimedDirective(directive=directive, applied_at=time.monotonic())
-        )
+        deadline = None if directive.ttl_ms is None else time.monotonic() + directive.ttl_ms / 1000
+        td = _TimedDirective(directive, expires_at=deadline)
+        self._active_directives.append(td)
+        if deadline is not None:
+            heapq.heappush(self._expiry_heap, (deadline, next(self._seq), td))
+        self._merge_directive(directive)
+        self._type_boost_cache.clear()
         self._logger.info(
             "attention_directive_applied",
             directive_id=directive.directive_id,
@@ -118,90 +165,182 @@ class AttentionFilter:
             ``None`` if the signal is discarded.
         """
         self._expire_directives()
-        score = self._compute_salience(signal)
+        return self._gate(signal, self._effective_threshold())
+
+    def evaluate_batch(self, signals: Sequence[Signal]) -> list[FilteredSignal | None]:
+        """
+        Evaluate a batch of signals against a single directive snapshot.
+
+        Directive expiry and the effective threshold are resolved once for the
+        whole batch rather than once per signal.
+
+        Parameters
+        ----------
+        signals:
+            The signals to evaluate.
+
+        Returns
+        -------
+        list[FilteredSignal | None]
+            One entry per input signal, in input order; ``None`` where the
+            signal was discarded.
+        """
+        self._expire_directives()
         threshold = self._effective_threshold()
+        return [self._gate(signal, threshold) for signal in signals]
 
-        salience = SalienceScore(
-            signal_id=signal.id,
-            score=score,
-            rationale=f"modality={signal.modality.value} priority={signal.priority}",
-        )
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
 
-        if score < threshold:
-            self._logger.debug(
-                "signal_gated_out",
-                signal_id=signal.id,
-                score=score,
-                threshold=threshold,
-            )
-            return None
+    def _gate(self, signal: Signal, threshold: float) -> FilteredSignal | None:
+        """Score, gate, and route a single signal against ``threshold``."""
+        self._evaluated += 1
+        log_signal = self._evaluated % self._log_sample_rate == 0
+
+        if signal.modality == Modality.CONTROL:
+            # Top-down control signals bypass salience scoring and threshold
+            # gating entirely; only the TTL check below still applies.
+            score = 1.0
+        else:
+            score = self._compute_salience(signal)
+            if score < threshold:
+                if log_signal:
+                    self._logger.debug(
+                        "signal_gated_out",
+                        signal_id=signal.id,
+                        score=score,
+                        threshold=threshold,
+                    )
+                return None
 
-        # TTL check
-        if signal.ttl is not None:
-            ingested = signal.ingested_at or datetime.now(tz=UTC)
-            age_ms = (datetime.now(tz=UTC) - ingested).total_seconds() * 1000
+        # TTL check — a signal without ingested_at has no measurable age, so it
+        # needs no clock read at all; otherwise one read suffices.
+        if signal.ttl is not None and signal.ingested_at is not None:
+            age_ms = (datetime.now(tz=UTC) - signal.ingested_at).total_seconds() * 1000
             if age_ms > signal.ttl:
-                self._logger.debug("signal_ttl_expired", signal_id=signal.id)
+                if log_signal:
+                    self._logger.debug("signal_ttl_expired", signal_id=signal.id)
                 return None
 
-        routed_to = _DEFAULT_ROUTING.get(signal.modality.value, "perception")
-
-        self._logger.info(
-            "signal_passed_gate",
+        routed_to = _DEFAULT_ROUTING.get(signal.modality, "perception")
+        # Built only for signals that pass: discarded signals never need a model.
+        # The validating constructor is used deliberately: for a model this
+        # small, pydantic-core validation is faster than model_construct().
+        salience = SalienceScore(
             signal_id=signal.id,
             score=score,
-            routed_to=routed_to,
+            rationale=f"modality={signal.modality} priority={signal.priority}",
         )
-        return FilteredSignal(signal=signal, salience=salience, routed_to=routed_to)
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+        if log_signal:
+            self._logger.info(
+                "signal_passed_gate",
+                signal_id=signal.id,
+                score=score,
+                routed_to=routed_to,
+            )
+        return FilteredSignal(signal=signal, salience=salience, routed_to=routed_to)
 
     def _compute_salience(self, signal: Signal) -> float:
         """
         Compute a salience score in [0, 1] for the given signal.
 
-        Base score: modality weight × (priority / 10)
+        Base score: modality weight × (0.5 + priority/10 × 0.5), read from the
+        precomputed ``_BASE_SALIENCE`` table.
         Directive boosts applied multiplicatively.
         """
-        base = _MODALITY_BASE_WEIGHT.get(signal.modality.value, 0.5)
-        priority_factor = signal.priority / 10.0
-        score = base * (0.5 + priority_factor * 0.5)  # blend base + priority
-
-        for td in self._active_directives:
-            d = td.directive
-            if signal.modality.value in d.modality_boost:
-                score *= d.modality_boost[signal.modality.value]
-            for type_prefix, mult in d.type_boost.items():
-                if signal.type.startswith(type_prefix):
-                    score *= mult
+        table = _BASE_SALIENCE.get(signal.modality)
+        if table is not None and 0 <= signal.priority <= 10:
+            score = table[signal.priority]
+        else:
+            base = _MODALITY_BASE_WEIGHT.get(signal.modality, 0.5)
+            priority_factor = signal.priority / 10.0
+            score = base * (0.5 + priority_factor * 0.5)  # blend base + priority
+
+        if self._modality_boost:
+            score *= self._modality_boost.get(signal.modality, 1.0)
+        if self._type_boost:
+            score *= self._type_multiplier(signal.type)
 
         return min(max(score, 0.0), 1.0)
 
+    def _type_multiplier(self, signal_type: str) -> float:
+        """
+        Return the combined ``type_boost`` multiplier for a signal type.
+
+        The result depends only on the active directive set, so it is memoised
+        per distinct ``signal.type`` and the cache is cleared whenever that set
+        changes (directive applied or expired).
+        """
+        mult = self._type_boost_cache.get(signal_type)
+        if mult is None:
+            mult = 1.0
+            for type_prefix, boost in self._type_boost.items():
+                if signal_type.startswith(type_prefix):
+                    mult *= boost
+            if len(self._type_boost_cache) >= _TYPE_BOOST_CACHE_MAX:
+                self._type_boost_cache.clear()
+            self._type_boost_cache[signal_type] = mult
+        return mult
+
+    def _merge_directive(self, directive: AttentionDirective) -> None:
+        """Fold a directive's boosts and threshold override into the merged state."""
+        for modality, mult in directive.modality_boost.items():
+            self._modality_boost[modality] = self._modality_boost.get(modality, 1.0) * mult
+        for type_prefix, mult in directive.type_boost.items():
+            self._type_boost[type_prefix] = self._type_boost.get(type_prefix, 1.0) * mult
+        if directive.threshold_override is not None:
+            self._threshold_override = directive.threshold_override
+
+    def _rebuild_merged_state(self) -> None:
+        """Recompute the merged boosts and threshold from the active directive list."""
+        self._modality_boost = {}
+        self._type_boost = {}
+        self._threshold_override = None
+        for td in self._active_directives:
+            self._merge_directive(td.directive)
+        self._type_boost_cache.clear()
+
     def _effective_threshold(self) -> float:
         """Return the most recently applied threshold override, or the default."""
-        for td in reversed(self._active_directives):
-            if td.directive.threshold_override is not None:
-                return td.directive.threshold_override
+        if self._threshold_override is not None:
+            return self._threshold_override
         return self._threshold
 
     def _expire_directives(self) -> None:
-        """Remove expired directives from the active list."""
+        """
+        Remove expired directives from the active list.
+
+        Only the head of the expiry heap is checked, so the common case (nothing
+        due) is O(1); the active list and merged state are rebuilt only when at
+        least one directive has actually expired.  The monotonic clock is read
+        at most once per call, and not at all when no TTL directive is pending.
+        """
+        heap = self._expiry_heap
+        if not heap:
+            return
         now = time.monotonic()
-        self._active_directives = [
-            td
-            for td in self._active_directives
-            if td.directive.ttl_ms is None
-            or (now - td.applied_at) * 1000 < td.directive.ttl_ms
-        ]
+        if heap[0][0] > now:
+            return
+        expired: set[_TimedDirective] = set()
+        while heap and heap[0][0] <= now:
+            expired.add(heapq.heappop(heap)[2])
+        self._active_directives = [td for td in self._active_directives if td not in expired]
+        self._rebuild_merged_state()
 
 
 class _TimedDirective:
-    """Internal wrapper pairing a directive with its application monotonic time."""
+    """
+    Internal wrapper pairing a directive with its expiry deadline.
+
+    ``expires_at`` is the absolute monotonic deadline derived from ``ttl_ms``
+    when the directive is applied (``None`` for directives without a TTL); it
+    is the key the directive is pushed onto the expiry heap with.
+    """
 
-    __slots__ = ("directive", "applied_at")
+    __slots__ = ("directive", "expires_at")
 
-    def __init__(self, directive: AttentionDirective, applied_at: float) -> None:
+    def __init__(self, directive: AttentionDirective, expires_at: float | None = None) -> None:
         self.directive = directive
-        self.applied_at = applied_at
+        self.expires_at = expires_at
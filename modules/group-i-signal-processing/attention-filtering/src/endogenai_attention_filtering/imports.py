@@ -32,13 +32,17 @@ class SignalSource(BaseModel):
     layer: str
     instance_id: str | None = Field(default=None, alias="instanceId")
 
-    model_config = {"populate_by_name": True}
+    # Immutable leaf; extra="forbid" mirrors additionalProperties: false in the schema.
+    model_config = {"populate_by_name": True, "frozen": True, "extra": "forbid"}
 
 
 class TraceContext(BaseModel):
     traceparent: str
     tracestate: str | None = None
 
+    # Propagated through all layers without modification (see signal.schema.json).
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class Signal(BaseModel):
     """Signal envelope — conforms to shared/types/signal.schema.json."""
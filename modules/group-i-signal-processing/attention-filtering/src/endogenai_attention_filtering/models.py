@@ -4,6 +4,9 @@ Data models for the Attention & Filtering Layer.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 from endogenai_attention_filtering.imports import Signal
@@ -16,14 +19,31 @@ class SalienceScore(BaseModel):
     score: float = Field(ge=0.0, le=1.0)
     rationale: str = ""
 
+    model_config = {"frozen": True}
+
 
-class FilteredSignal(BaseModel):
-    """A signal that has passed attention gating, augmented with its salience score."""
+@dataclass(slots=True)
+class FilteredSignal:
+    """
+    A signal that has passed attention gating, augmented with its salience score.
+
+    A plain slotted dataclass rather than a pydantic model: it is built once per
+    passing signal from an already-validated Signal and SalienceScore, so there
+    is nothing left to validate.
+    """
 
     signal: Signal
     salience: SalienceScore
     routed_to: str | None = None  # downstream module id
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return a plain-dict representation, equivalent to a pydantic model_dump()."""
+        return {
+            "signal": self.signal.model_dump(),
+            "salience": self.salience.model_dump(),
+            "routed_to": self.routed_to,
+        }
+
 
 class AttentionDirective(BaseModel):
     """
@@ -50,3 +70,8 @@ class AttentionDirective(BaseModel):
     )
     session_id: str | None = None
     ttl_ms: int | None = None  # directive expires after this many milliseconds
+
+    # frozen stops field reassignment only; the boost dicts stay mutable in place.
+    # AttentionFilter folds them into its merged state when a directive is
+    # applied, so editing them afterwards is unsupported: apply a new directive.
+    model_config = {"frozen": True, "extra": "forbid"}
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
 import pytest
 
-from endogenai_attention_filtering.filter import AttentionFilter
+from endogenai_attention_filtering.filter import _MODALITY_BASE_WEIGHT, AttentionFilter
 from endogenai_attention_filtering.imports import Modality, Signal, SignalSource
 from endogenai_attention_filtering.models import AttentionDirective, FilteredSignal
 
@@ -43,6 +46,31 @@ class TestAttentionFilter:
         result = af.evaluate(signal)
         assert result is not None
 
+    def test_control_signal_bypasses_scoring(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        with patch.object(af, "_compute_salience") as compute:
+            result = af.evaluate(_make_signal(modality=Modality.CONTROL, priority=0))
+        compute.assert_not_called()
+        assert result is not None
+        assert result.salience.score == 1.0
+        assert result.routed_to == "executive"
+
+    def test_control_signal_passes_raised_threshold_override(self) -> None:
+        af = AttentionFilter(threshold=0.3)
+        af.apply_directive(
+            AttentionDirective(
+                directive_id="suppress", threshold_override=1.0, modality_boost={"control": 0.1}
+            )
+        )
+        assert af.evaluate(_make_signal(modality=Modality.CONTROL, priority=0)) is not None
+
+    def test_expired_control_signal_is_discarded(self) -> None:
+        af = AttentionFilter()
+        signal = _make_signal(modality=Modality.CONTROL, priority=10)
+        signal.ingested_at = datetime.now(tz=UTC) - timedelta(seconds=5)
+        signal.ttl = 1000
+        assert af.evaluate(signal) is None
+
     def test_routing_text_to_perception(self) -> None:
         af = AttentionFilter()
         signal = _make_signal(modality=Modality.TEXT, priority=7)
@@ -106,10 +134,49 @@ class TestAttentionFilter:
         # Directive expired; default threshold of 0.8 applies
         assert af.evaluate(signal) is None
 
+    def test_only_due_directives_expire(self) -> None:
+        import time
+
+        af = AttentionFilter(threshold=0.8)
+        af.apply_directive(
+            AttentionDirective(directive_id="long", threshold_override=0.2, ttl_ms=60_000)
+        )
+        af.apply_directive(
+            AttentionDirective(directive_id="short", threshold_override=0.9, ttl_ms=1)
+        )
+        signal = _make_signal(priority=5)
+        assert af.evaluate(signal) is None  # "short" (0.9) is the latest override
+
+        time.sleep(0.01)
+        # "short" expired; "long" (0.2) is still in force
+        assert af.evaluate(signal) is not None
+
     def test_invalid_threshold_raises(self) -> None:
         with pytest.raises(ValueError):
             AttentionFilter(threshold=1.5)
 
+    def test_invalid_log_sample_rate_raises(self) -> None:
+        with pytest.raises(ValueError):
+            AttentionFilter(log_sample_rate=0)
+
+    def test_log_sample_rate_limits_per_signal_events(self) -> None:
+        af = AttentionFilter(threshold=0.0, log_sample_rate=3)
+        with patch.object(af, "_logger") as logger:
+            for _ in range(7):
+                assert af.evaluate(_make_signal(priority=5)) is not None
+        assert logger.info.call_count == 2
+
+    def test_gated_out_signal_builds_no_salience_model(self) -> None:
+        af = AttentionFilter(threshold=0.5)
+        with patch("endogenai_attention_filtering.filter.SalienceScore") as salience_cls:
+            assert af.evaluate(_make_signal(priority=0)) is None
+        salience_cls.assert_not_called()
+
+    def test_log_sample_rate_does_not_affect_gating(self) -> None:
+        af = AttentionFilter(threshold=0.5, log_sample_rate=100)
+        assert af.evaluate(_make_signal(priority=0)) is None
+        assert af.evaluate(_make_signal(priority=10)) is not None
+
 
 class TestAttentionFilterRouting:
     """Verify every modality is routed to the expected downstream module."""
@@ -193,6 +260,34 @@ class TestAttentionFilterTypeBoost:
         af.apply_directive(directive)
         assert af.evaluate(signal) is None
 
+    def test_type_boost_applied_after_first_evaluation_takes_effect(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        signal = _make_signal(modality=Modality.TEXT, priority=3, signal_type="text.input")
+        af.apply_directive(AttentionDirective(directive_id="d1", type_boost={"audio": 2.0}))
+        first = af.evaluate(signal)
+        assert first is not None
+
+        af.apply_directive(AttentionDirective(directive_id="d2", type_boost={"text": 2.0}))
+        second = af.evaluate(signal)
+        assert second is not None
+        assert second.salience.score == pytest.approx(first.salience.score * 2.0)
+
+    def test_expired_type_boost_no_longer_applied(self) -> None:
+        import time
+
+        af = AttentionFilter(threshold=0.0)
+        signal = _make_signal(modality=Modality.TEXT, priority=3, signal_type="text.input")
+        plain = af.evaluate(signal)
+        assert plain is not None
+
+        af.apply_directive(
+            AttentionDirective(directive_id="short", type_boost={"text": 2.0}, ttl_ms=1)
+        )
+        time.sleep(0.01)
+        result = af.evaluate(signal)
+        assert result is not None
+        assert result.salience.score == pytest.approx(plain.salience.score)
+
 
 class TestAttentionFilterMultipleDirectives:
     """Verify behaviour when multiple directives are active simultaneously."""
@@ -213,6 +308,35 @@ class TestAttentionFilterMultipleDirectives:
         # Score should be boosted beyond base by both multipliers
         assert result_boosted.salience.score > base_score
 
+    def test_same_type_prefix_across_directives_stacks(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        signal = _make_signal(modality=Modality.TEXT, priority=0)
+        plain = af.evaluate(signal)
+        assert plain is not None
+
+        af.apply_directive(AttentionDirective(directive_id="d1", type_boost={"text": 1.5}))
+        af.apply_directive(AttentionDirective(directive_id="d2", type_boost={"text": 2.0}))
+        result = af.evaluate(signal)
+        assert result is not None
+        assert result.salience.score == pytest.approx(plain.salience.score * 3.0)
+
+    def test_expired_modality_boost_is_removed_from_combined_state(self) -> None:
+        import time
+
+        af = AttentionFilter(threshold=0.0)
+        signal = _make_signal(modality=Modality.TEXT, priority=0)
+        af.apply_directive(AttentionDirective(directive_id="keep", modality_boost={"text": 1.5}))
+        af.apply_directive(
+            AttentionDirective(directive_id="short", modality_boost={"text": 2.0}, ttl_ms=1)
+        )
+        boosted = af.evaluate(signal)
+        assert boosted is not None
+
+        time.sleep(0.01)
+        result = af.evaluate(signal)
+        assert result is not None
+        assert result.salience.score == pytest.approx(boosted.salience.score / 2.0)
+
     def test_latest_threshold_override_wins(self) -> None:
         af = AttentionFilter(threshold=0.5)
         signal = _make_signal(modality=Modality.TEXT, priority=3)
@@ -225,6 +349,86 @@ class TestAttentionFilterMultipleDirectives:
         af.apply_directive(AttentionDirective(directive_id="d-lower", threshold_override=0.1))
         assert af.evaluate(signal) is not None
 
+    def test_expired_threshold_override_falls_back_to_earlier_override(self) -> None:
+        import time
+
+        af = AttentionFilter(threshold=0.5)
+        signal = _make_signal(modality=Modality.TEXT, priority=3)
+        af.apply_directive(AttentionDirective(directive_id="d-raise", threshold_override=0.9))
+        af.apply_directive(
+            AttentionDirective(directive_id="d-lower", threshold_override=0.1, ttl_ms=1)
+        )
+        assert af.evaluate(signal) is not None
+
+        time.sleep(0.01)
+        assert af.evaluate(signal) is None
+
+
+class TestAttentionFilterBaseSalience:
+    """Verify the precomputed base-salience table matches the scoring formula."""
+
+    @pytest.mark.parametrize("modality", list(_MODALITY_BASE_WEIGHT))
+    def test_table_matches_formula_for_every_priority(self, modality: Modality) -> None:
+        af = AttentionFilter(threshold=0.0)
+        weight = _MODALITY_BASE_WEIGHT[modality]
+        for priority in range(11):
+            result = af.evaluate(_make_signal(modality=modality, priority=priority))
+            assert result is not None
+            expected = min(weight * (0.5 + (priority / 10.0) * 0.5), 1.0)
+            assert result.salience.score == expected
+
+    def test_out_of_range_priority_falls_back_to_formula(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        signal = _make_signal(priority=5)
+        signal.priority = 12  # bypasses field validation
+        result = af.evaluate(signal)
+        assert result is not None
+        assert result.salience.score == min(0.6 * (0.5 + 1.2 * 0.5), 1.0)
+
+
+class TestAttentionFilterBatch:
+    """Verify evaluate_batch() matches per-signal evaluate()."""
+
+    def test_batch_results_align_with_inputs(self) -> None:
+        af = AttentionFilter(threshold=0.5)
+        signals = [
+            _make_signal(priority=0),
+            _make_signal(modality=Modality.CONTROL, priority=5),
+            _make_signal(priority=10),
+        ]
+        results = af.evaluate_batch(signals)
+        assert len(results) == 3
+        assert results[0] is None
+        assert results[1] is not None and results[1].routed_to == "executive"
+        assert results[2] is not None and results[2].signal.id == signals[2].id
+
+    def test_batch_scores_match_single_evaluation(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        af.apply_directive(
+            AttentionDirective(
+                directive_id="d", modality_boost={"text": 1.2}, type_boost={"text": 1.1}
+            )
+        )
+        signals = [_make_signal(priority=p) for p in (1, 4, 7)]
+        batch = af.evaluate_batch(signals)
+        for signal, batched in zip(signals, batch, strict=True):
+            single = af.evaluate(signal)
+            assert single is not None and batched is not None
+            assert batched.salience.score == single.salience.score
+
+    def test_empty_batch_returns_empty_list(self) -> None:
+        assert AttentionFilter().evaluate_batch([]) == []
+
+    def test_batch_reads_directive_clock_once(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        af.apply_directive(AttentionDirective(directive_id="d", ttl_ms=60_000))
+        signals = [_make_signal(priority=p) for p in range(5)]
+        with patch(
+            "endogenai_attention_filtering.filter.time.monotonic", return_value=0.0
+        ) as monotonic:
+            af.evaluate_batch(signals)
+        assert monotonic.call_count == 1
+
 
 class TestAttentionFilterSignalTTL:
     """Verify signal TTL handling in evaluate()."""
@@ -237,6 +441,20 @@ class TestAttentionFilterSignalTTL:
         result = af.evaluate(signal)
         assert result is not None
 
+    def test_signal_past_ttl_is_discarded(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        signal = _make_signal(modality=Modality.TEXT, priority=5)
+        signal.ingested_at = datetime.now(tz=UTC) - timedelta(seconds=5)
+        signal.ttl = 1000
+        assert af.evaluate(signal) is None
+
+    def test_signal_without_ingested_at_is_not_aged(self) -> None:
+        af = AttentionFilter(threshold=0.0)
+        signal = _make_signal(modality=Modality.TEXT, priority=5)
+        signal.ingested_at = None
+        signal.ttl = 0
+        assert af.evaluate(signal) is not None
+
     def test_salience_rationale_contains_modality_and_priority(self) -> None:
         af = AttentionFilter(threshold=0.0)
         signal = _make_signal(modality=Modality.TEXT, priority=7)
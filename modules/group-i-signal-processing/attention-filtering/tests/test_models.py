@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
-from endogenai_attention_filtering.imports import Modality, Signal, SignalSource
+from endogenai_attention_filtering.imports import Modality, Signal, SignalSource, TraceContext
 from endogenai_attention_filtering.models import (
     AttentionDirective,
     FilteredSignal,
@@ -56,6 +56,11 @@ class TestSalienceScore:
         with pytest.raises(ValidationError):
             SalienceScore(signal_id="abc", score=-0.01)
 
+    def test_score_is_immutable(self) -> None:
+        s = SalienceScore(signal_id="abc", score=0.5)
+        with pytest.raises(ValidationError):
+            s.score = 0.9  # type: ignore[misc]
+
 
 class TestFilteredSignal:
     def test_signal_and_salience_stored(self) -> None:
@@ -90,6 +95,15 @@ class TestFilteredSignal:
         fs = FilteredSignal(signal=signal, salience=salience, routed_to="perception")
         assert fs.salience.signal_id == fs.signal.id
 
+    def test_to_dict_serialises_nested_models(self) -> None:
+        signal = _make_signal()
+        salience = SalienceScore(signal_id=signal.id, score=0.9)
+        fs = FilteredSignal(signal=signal, salience=salience, routed_to="perception")
+        data = fs.to_dict()
+        assert data["signal"] == signal.model_dump()
+        assert data["salience"] == {"signal_id": signal.id, "score": 0.9, "rationale": ""}
+        assert data["routed_to"] == "perception"
+
 
 class TestAttentionDirective:
     def test_directive_id_stored(self) -> None:
@@ -132,8 +146,33 @@ class TestAttentionDirective:
         with pytest.raises(ValidationError):
             AttentionDirective(directive_id="d-1", threshold_override=-0.1)
 
+    def test_directive_fields_cannot_be_reassigned(self) -> None:
+        d = AttentionDirective(directive_id="d-1", ttl_ms=100)
+        with pytest.raises(ValidationError):
+            d.ttl_ms = 200  # type: ignore[misc]
+
+    def test_unknown_directive_field_raises(self) -> None:
+        with pytest.raises(ValidationError):
+            AttentionDirective(directive_id="d-1", modality_bost={"text": 2.0})  # type: ignore[call-arg]
+
     def test_threshold_override_at_boundaries(self) -> None:
         d_low = AttentionDirective(directive_id="d-low", threshold_override=0.0)
         d_high = AttentionDirective(directive_id="d-high", threshold_override=1.0)
         assert d_low.threshold_override == 0.0
         assert d_high.threshold_override == 1.0
+
+
+class TestSignalLeafModels:
+    def test_signal_source_is_immutable(self) -> None:
+        src = SignalSource(moduleId="sensory-input", layer="sensory-input")
+        with pytest.raises(ValidationError):
+            src.layer = "perception"  # type: ignore[misc]
+
+    def test_signal_source_rejects_unknown_fields(self) -> None:
+        with pytest.raises(ValidationError):
+            SignalSource(moduleId="sensory-input", layer="sensory-input", region="x")  # type: ignore[call-arg]
+
+    def test_trace_context_is_immutable(self) -> None:
+        tc = TraceContext(traceparent="00-" + "a" * 32 + "-" + "b" * 16 + "-01")
+        with pytest.raises(ValidationError):
+            tc.tracestate = "k=v"  # type: ignore[misc]
@@ -30,13 +30,17 @@ class SignalSource(BaseModel):
     layer: str
     instance_id: str | None = Field(default=None, alias="instanceId")
 
-    model_config = {"populate_by_name": True}
+    # Immutable leaf; unknown fields are ignored (pydantic default).
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class TraceContext(BaseModel):
     traceparent: str
     tracestate: str | None = None
 
+    # Propagated through all layers without modification (see signal.schema.json).
+    model_config = {"frozen": True}
+
 
 class Signal(BaseModel):
     """Signal envelope — conforms to shared/types/signal.schema.json."""
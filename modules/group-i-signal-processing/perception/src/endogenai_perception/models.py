@@ -61,3 +61,7 @@ class PerceptionResult(BaseModel):
         description="ID of the vector record written to brain.perception.",
     )
     embedding_model: str | None = None
+
+    # Results are final once returned; PerceptualFeatures stays mutable because
+    # the pipeline records raw_embedding_text on it after extraction.
+    model_config = {"frozen": True}
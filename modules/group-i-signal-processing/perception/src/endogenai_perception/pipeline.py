@@ -19,26 +19,47 @@ Usage
 ... )
 >>> pipeline = PerceptionPipeline(vector_store=adapter)
 >>> result = await pipeline.process(filtered_signal)
+>>> results = await pipeline.process_batch([signal_a, signal_b])
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import uuid
-from typing import Any
+from datetime import UTC, datetime
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 import litellm
 import structlog
 from endogenai_vector_store import VectorStoreAdapter
 from endogenai_vector_store.models import MemoryItem, MemoryType, UpsertRequest
 
-from endogenai_perception.imports import Signal
+from endogenai_perception.imports import Modality, Signal
 from endogenai_perception.models import PerceptionResult, PerceptualFeatures
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
 log = structlog.get_logger(__name__)
 
 _COLLECTION = "brain.perception"
 
+# Bounds on LLM-reported entities, matching the "max 10" asked for in the
+# prompt, so a runaway response cannot inflate the embedding text.
+_MAX_ENTITIES = 10
+_MAX_ENTITY_CHARS = 64
+# Structured payloads contribute at most this many keys as entities.
+_MAX_PAYLOAD_KEYS = 32
+
+# Text shorter than this once stripped carries nothing for the LLM to extract,
+# so it gets empty features without a call.
+_MIN_LLM_CHARS = 3
+
+# Record importance by signal priority (0–10): priority / 10.
+_PRIORITY_TO_IMPORTANCE: tuple[float, ...] = tuple(p / 10.0 for p in range(11))
+
 _FEATURE_EXTRACTION_PROMPT = """\
 You are a perceptual feature extractor.  Given the signal below, extract:
 - entities: list of named entities, objects, or key concepts (max 10)
@@ -53,6 +74,22 @@ Signal content: {content}
 """
 
 
+def _split_prompt(template: str) -> tuple[str, str, str]:
+    """Split ``template`` into the text before, between and after its placeholders."""
+    head, _, rest = template.partition("{modality}")
+    mid, _, tail = rest.partition("{content}")
+    return head, mid, tail
+
+
+# The template split around its two placeholders, so prompts are built by
+# plain concatenation instead of re-parsing the format string per signal.
+_PROMPT_HEAD, _PROMPT_MID, _PROMPT_TAIL = _split_prompt(_FEATURE_EXTRACTION_PROMPT)
+assert (
+    _PROMPT_HEAD + "{modality}" + _PROMPT_MID + "{content}" + _PROMPT_TAIL
+    == _FEATURE_EXTRACTION_PROMPT
+), "feature extraction prompt must contain {modality} followed by {content}"
+
+
 class PerceptionPipeline:
     """
     Signal perception pipeline.
@@ -69,6 +106,14 @@ class PerceptionPipeline:
         LiteLLM model string for embedding (default: ``"ollama/nomic-embed-text"``).
     module_id:
         Canonical module id for logging.
+    text_cache_size:
+        Maximum number of distinct text contents whose LLM-extracted features
+        are remembered, so repeated content skips the LLM call.  The oldest
+        entry is evicted first; ``0`` disables the cache.
+    llm_concurrency:
+        Maximum number of LLM extraction calls in flight at once across this
+        pipeline (``process`` and ``process_batch`` alike), to respect provider
+        rate limits when a batch fans out.
     """
 
     def __init__(
@@ -77,12 +122,34 @@ class PerceptionPipeline:
         llm_model: str = "ollama/llama3.2",
         embed_model: str = "ollama/nomic-embed-text",
         module_id: str = "perception",
+        text_cache_size: int = 1024,
+        llm_concurrency: int = 16,
     ) -> None:
+        if text_cache_size < 0:
+            raise ValueError(f"text_cache_size must be >= 0, got {text_cache_size}")
+        if llm_concurrency < 1:
+            raise ValueError(f"llm_concurrency must be >= 1, got {llm_concurrency}")
         self._vs = vector_store
         self._llm_model = llm_model
         self._embed_model = embed_model
         self._module_id = module_id
         self._logger = log.bind(module_id=module_id)
+        # Heuristic (synchronous) extractors by modality; text goes through the
+        # LLM and any modality not listed here is treated as structured.
+        self._heuristic_extractors: dict[Modality, Callable[[Signal], PerceptualFeatures]] = {
+            Modality.IMAGE: self._extract_media_features,
+            Modality.AUDIO: self._extract_media_features,
+        }
+        # Truncated text content → (entities, intent, summary, language) from a
+        # successful LLM extraction, in insertion order for FIFO eviction.
+        self._text_cache_size = text_cache_size
+        self._text_cache: dict[str, tuple[tuple[str, ...], str | None, str | None, str | None]] = {}
+        # Created lazily inside the running loop (see _llm_slots): an asyncio
+        # primitive binds to the first loop that waits on it, and a pipeline may
+        # outlive that loop.
+        self._llm_concurrency = llm_concurrency
+        self._llm_semaphore: asyncio.Semaphore | None = None
+        self._llm_semaphore_loop: asyncio.AbstractEventLoop | None = None
 
     async def process(self, signal: Signal) -> PerceptionResult:
         """
@@ -107,69 +174,161 @@ class PerceptionPipeline:
         """
         self._logger.info("perception_processing", signal_id=signal.id)
 
-        features = await self._extract_features(signal)
-        embedding_text = self._build_embedding_text(features)
-        features.raw_embedding_text = embedding_text
-
-        embedding_id = await self._embed_and_store(signal, features, embedding_text)
+        if signal.modality == Modality.TEXT:
+            features = await self._extract_text_features(signal)
+        else:
+            features = self._extract_heuristic_features(signal)
+        item = self._build_memory_item(signal, features, _now_iso())
+        await self._vs.upsert(UpsertRequest(collection_name=_COLLECTION, items=[item]))
 
         self._logger.info(
             "perception_complete",
             signal_id=signal.id,
-            embedding_id=embedding_id,
+            embedding_id=item.id,
         )
 
-        return PerceptionResult(
-            signal_id=signal.id,
-            features=features,
-            embedding_id=embedding_id,
-            embedding_model=self._embed_model,
+        return self._build_result(signal, features, item.id)
+
+    async def process_batch(self, signals: Sequence[Signal]) -> list[PerceptionResult]:
+        """
+        Process a batch of signals, overlapping LLM calls and sharing one upsert.
+
+        LLM extraction runs concurrently across the batch's text signals (up to
+        ``llm_concurrency`` calls in flight), so they pay roughly one round trip
+        rather than one each; other modalities are extracted inline.  Every
+        feature record is written to brain.perception in a single upsert request.
+
+        Parameters
+        ----------
+        signals:
+            The filtered signals to perceive.
+
+        Returns
+        -------
+        list[PerceptionResult]
+            One result per input signal, in input order.
+        """
+        if not signals:
+            return []
+        self._logger.info("perception_batch_processing", count=len(signals))
+
+        text_features = iter(
+            await asyncio.gather(
+                *(self._extract_text_features(s) for s in signals if s.modality == Modality.TEXT)
+            )
         )
+        features_list = [
+            next(text_features)
+            if s.modality == Modality.TEXT
+            else self._extract_heuristic_features(s)
+            for s in signals
+        ]
+        created_at = _now_iso()  # one clock read shared by every record in the batch
+        items = [
+            self._build_memory_item(signal, features, created_at)
+            for signal, features in zip(signals, features_list, strict=True)
+        ]
+        await self._vs.upsert(UpsertRequest(collection_name=_COLLECTION, items=items))
+
+        self._logger.info("perception_batch_complete", count=len(signals))
+
+        return [
+            self._build_result(signal, features, item.id)
+            for signal, features, item in zip(signals, features_list, items, strict=True)
+        ]
 
     # ------------------------------------------------------------------
     # Feature extraction
     # ------------------------------------------------------------------
 
-    async def _extract_features(self, signal: Signal) -> PerceptualFeatures:
-        """Extract perceptual features appropriate to the signal modality."""
-        if signal.modality.value == "text":
-            return await self._extract_text_features(signal)
-        if signal.modality.value in ("image", "audio"):
-            return self._extract_media_features(signal)
-        return self._extract_structured_features(signal)
+    def _extract_heuristic_features(self, signal: Signal) -> PerceptualFeatures:
+        """
+        Extract features for a non-text signal without calling the LLM.
+
+        Dispatches on modality through ``_heuristic_extractors``; this path is
+        synchronous, so callers avoid a coroutine per non-text signal.
+        """
+        extractor = self._heuristic_extractors.get(
+            signal.modality, self._extract_structured_features
+        )
+        return extractor(signal)
 
     async def _extract_text_features(self, signal: Signal) -> PerceptualFeatures:
-        """Use LiteLLM to extract semantic features from a text signal."""
+        """
+        Use LiteLLM to extract semantic features from a text signal.
+
+        Features from successful extractions are cached by content, so a
+        repeated text skips the LLM call; failed extractions are not cached.
+        Trivially short text (under ``_MIN_LLM_CHARS`` once stripped) gets
+        empty features without an LLM call.
+        """
         content = str(signal.payload) if signal.payload is not None else ""
+        content = content[:2000]  # guard against huge payloads
+        if len(content.strip()) < _MIN_LLM_CHARS:
+            return PerceptualFeatures(signal_id=signal.id, modality=signal.modality.value)
+
+        cached = self._text_cache.get(content)
+        if cached is not None:
+            entities, intent, summary, language = cached
+            return PerceptualFeatures(
+                signal_id=signal.id,
+                modality=signal.modality.value,
+                entities=list(entities),
+                intent=intent,
+                summary=summary,
+                language=language,
+            )
 
-        prompt = _FEATURE_EXTRACTION_PROMPT.format(
-            modality=signal.modality.value,
-            content=content[:2000],  # guard against huge payloads
-        )
+        prompt = _PROMPT_HEAD + signal.modality.value + _PROMPT_MID + content + _PROMPT_TAIL
 
         try:
-            response = await litellm.acompletion(
-                model=self._llm_model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.0,
-                max_tokens=256,
-            )
+            async with self._llm_slots():
+                response = await litellm.acompletion(
+                    model=self._llm_model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.0,
+                    max_tokens=256,
+                )
             raw_json = response.choices[0].message.content or "{}"
-            parsed: dict[str, Any] = json.loads(raw_json)
+            parsed: dict[str, Any] = json.loads(_extract_json_object(raw_json))
         except Exception as exc:  # noqa: BLE001
             self._logger.warning(
                 "llm_extraction_failed", signal_id=signal.id, error=str(exc)
             )
-            parsed = {}
+            return PerceptualFeatures(signal_id=signal.id, modality=signal.modality.value)
 
-        return PerceptualFeatures(
+        features = PerceptualFeatures(
             signal_id=signal.id,
             modality=signal.modality.value,
-            entities=parsed.get("entities") or [],
-            intent=parsed.get("intent"),
-            summary=parsed.get("summary"),
-            language=parsed.get("language"),
+            entities=_clean_entities(parsed.get("entities")),
+            intent=_clean_text(parsed.get("intent")),
+            summary=_clean_text(parsed.get("summary")),
+            language=_clean_text(parsed.get("language")),
         )
+        if self._text_cache_size:
+            cache = self._text_cache
+            if len(cache) >= self._text_cache_size:
+                del cache[next(iter(cache))]
+            cache[content] = (
+                tuple(features.entities),
+                features.intent,
+                features.summary,
+                features.language,
+            )
+        return features
+
+    def _llm_slots(self) -> asyncio.Semaphore:
+        """
+        Return the semaphore bounding LLM calls for the running event loop.
+
+        Rebuilt when the pipeline is first used from a different loop (e.g. a
+        new ``asyncio.run``), since a semaphore cannot be awaited across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore is None or self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(self._llm_concurrency)
+            self._llm_semaphore_loop = loop
+        return self._llm_semaphore
 
     def _extract_media_features(self, signal: Signal) -> PerceptualFeatures:
         """Heuristic feature extraction for image/audio signals."""
@@ -181,17 +340,25 @@ class PerceptionPipeline:
         )
 
     def _extract_structured_features(self, signal: Signal) -> PerceptualFeatures:
-        """Heuristic feature extraction for structured/sensor/event signals."""
+        """
+        Heuristic feature extraction for structured/sensor/event signals.
+
+        The first ``_MAX_PAYLOAD_KEYS`` keys of a dict payload become entities;
+        the summary still reports the full field count.
+        """
+        payload = signal.payload
         payload_keys: list[str] = []
-        if isinstance(signal.payload, dict):
-            payload_keys = list(signal.payload.keys())
+        field_count = 0
+        if isinstance(payload, dict):
+            field_count = len(payload)
+            payload_keys = list(islice(payload, _MAX_PAYLOAD_KEYS))
 
         return PerceptualFeatures(
             signal_id=signal.id,
             modality=signal.modality.value,
             entities=payload_keys,
             intent="observation",
-            summary=f"{signal.type} signal with {len(payload_keys)} fields",
+            summary=f"{signal.type} signal with {field_count} fields",
         )
 
     # ------------------------------------------------------------------
@@ -200,34 +367,53 @@ class PerceptionPipeline:
 
     @staticmethod
     def _build_embedding_text(features: PerceptualFeatures) -> str:
-        """Build a text string to embed from extracted features."""
-        parts: list[str] = []
-        if features.summary:
-            parts.append(features.summary)
-        if features.entities:
-            parts.append("Entities: " + ", ".join(features.entities))
-        if features.intent:
-            parts.append(f"Intent: {features.intent}")
-        return " | ".join(parts) if parts else f"signal:{features.signal_id}"
-
-    async def _embed_and_store(
-        self,
-        signal: Signal,
-        features: PerceptualFeatures,
-        embedding_text: str,
-    ) -> str:
-        """Embed the feature text and upsert into brain.perception."""
-        from datetime import UTC, datetime
+        """
+        Build a text string to embed from extracted features.
+
+        Joins the non-empty parts as ``summary | Entities: ... | Intent: ...``,
+        falling back to ``signal:<id>`` when none are present.  Each field is
+        read once, and a summary-only record is returned as-is without building
+        an intermediate list.
+        """
+        summary = features.summary
+        entities = features.entities
+        intent = features.intent
+        if not entities and not intent:
+            return summary or f"signal:{features.signal_id}"
+
+        text = summary + " | " if summary else ""
+        if entities:
+            text += "Entities: " + ", ".join(entities)
+            if intent:
+                text += " | Intent: " + intent
+        elif intent:
+            text += "Intent: " + intent
+        return text
+
+    def _build_memory_item(
+        self, signal: Signal, features: PerceptualFeatures, created_at: str
+    ) -> MemoryItem:
+        """
+        Build the brain.perception record for a signal's extracted features.
+
+        Also records the embedding text on ``features.raw_embedding_text``.
+        The caller supplies the ISO-8601 ``created_at`` timestamp and upserts
+        the returned item (alone or as part of a batch).
+        """
+        embedding_text = self._build_embedding_text(features)
+        features.raw_embedding_text = embedding_text
 
         embedding_id = str(uuid.uuid4())
+        priority = signal.priority
+        importance = _PRIORITY_TO_IMPORTANCE[priority] if 0 <= priority <= 10 else priority / 10.0
 
-        item = MemoryItem(
+        return MemoryItem(
             id=embedding_id,
             collection_name=_COLLECTION,
             content=embedding_text,
             type=MemoryType.SHORT_TERM,
             source_module=self._module_id,
-            created_at=datetime.now(tz=UTC).isoformat(),
+            created_at=created_at,
             metadata={
                 "signal_id": signal.id,
                 "modality": features.modality,
@@ -236,8 +422,65 @@ class PerceptionPipeline:
                 "session_id": signal.session_id or "",
                 "signal_type": signal.type,
             },
-            importance_score=signal.priority / 10.0,
+            importance_score=importance,
         )
 
-        await self._vs.upsert(UpsertRequest(collection_name=_COLLECTION, items=[item]))
-        return embedding_id
+    def _build_result(
+        self, signal: Signal, features: PerceptualFeatures, embedding_id: str
+    ) -> PerceptionResult:
+        """Wrap extracted features and the stored record id into a PerceptionResult."""
+        return PerceptionResult(
+            signal_id=signal.id,
+            features=features,
+            embedding_id=embedding_id,
+            embedding_model=self._embed_model,
+        )
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string."""
+    return datetime.now(tz=UTC).isoformat()
+
+
+def _extract_json_object(raw: str) -> str:
+    """
+    Slice the outermost ``{...}`` span out of an LLM response.
+
+    Models often wrap the requested JSON in prose or Markdown code fences;
+    taking the text between the first ``{`` and the last ``}`` recovers the
+    object without a regex.  Text with no such span is returned unchanged so
+    that ``json.loads`` reports the failure.
+    """
+    start = raw.find("{")
+    end = raw.rfind("}")
+    if start == -1 or end < start:
+        return raw
+    return raw[start : end + 1]
+
+
+def _clean_entities(raw: Any) -> list[str]:
+    """
+    Normalise the LLM-reported entity list.
+
+    Keeps string entries only, truncates each to ``_MAX_ENTITY_CHARS``, drops
+    empty strings and duplicates (first occurrence wins) and stops after
+    ``_MAX_ENTITIES``.  The list is short, so membership is checked on the
+    list itself rather than through a set.
+    """
+    if not isinstance(raw, list):
+        return []
+    entities: list[str] = []
+    for entity in raw:
+        if not isinstance(entity, str):
+            continue
+        entity = entity[:_MAX_ENTITY_CHARS]
+        if entity and entity not in entities:
+            entities.append(entity)
+            if len(entities) == _MAX_ENTITIES:
+                break
+    return entities
+
+
+def _clean_text(raw: Any) -> str | None:
+    """Return an LLM-reported scalar field if it is a string, else ``None``."""
+    return raw if isinstance(raw, str) else None
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import pytest
+from pydantic import ValidationError
+
+from endogenai_perception.imports import SignalSource, TraceContext
 from endogenai_perception.models import PerceptionResult, PerceptualFeatures
 from endogenai_perception.pipeline import PerceptionPipeline
 
@@ -101,6 +105,32 @@ class TestPerceptionResult:
         )
         assert r.embedding_model == "ollama/nomic-embed-text"
 
+    def test_result_is_immutable(self) -> None:
+        f = PerceptualFeatures(signal_id="s1", modality="text")
+        r = PerceptionResult(signal_id="s1", features=f)
+        with pytest.raises(ValidationError):
+            r.embedding_id = "emb-2"  # type: ignore[misc]
+
+
+class TestSignalLeafModels:
+    def test_signal_source_is_immutable(self) -> None:
+        source = SignalSource(moduleId="attention-filtering", layer="attention-filtering")
+        with pytest.raises(ValidationError):
+            source.layer = "perception"  # type: ignore[misc]
+
+    def test_signal_source_ignores_unknown_field(self) -> None:
+        source = SignalSource(moduleId="m", layer="l", region="x")  # type: ignore[call-arg]
+        assert not hasattr(source, "region")
+
+    def test_trace_context_is_immutable(self) -> None:
+        trace = TraceContext(traceparent="00-abc-def-01")
+        with pytest.raises(ValidationError):
+            trace.tracestate = "k=v"  # type: ignore[misc]
+
+    def test_trace_context_ignores_unknown_field(self) -> None:
+        trace = TraceContext(traceparent="00-abc-def-01", baggage="x")  # type: ignore[call-arg]
+        assert not hasattr(trace, "baggage")
+
 
 class TestBuildEmbeddingText:
     """Tests for PerceptionPipeline._build_embedding_text (static helper)."""
@@ -148,3 +178,15 @@ class TestBuildEmbeddingText:
         )
         result = PerceptionPipeline._build_embedding_text(f)
         assert "alpha, beta, gamma" in result
+
+    def test_all_fields_exact_format(self) -> None:
+        f = PerceptualFeatures(
+            signal_id="s1", modality="text", summary="S.", entities=["a", "b"], intent="question"
+        )
+        result = PerceptionPipeline._build_embedding_text(f)
+        assert result == "S. | Entities: a, b | Intent: question"
+
+    def test_summary_and_intent_exact_format(self) -> None:
+        f = PerceptualFeatures(signal_id="s1", modality="text", summary="S.", intent="command")
+        result = PerceptionPipeline._build_embedding_text(f)
+        assert result == "S. | Intent: command"
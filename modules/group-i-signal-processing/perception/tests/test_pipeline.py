@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -112,6 +114,17 @@ class TestPerceptionPipeline:
 
         assert set(result.features.entities) == {"temperature", "humidity"}
 
+    @pytest.mark.asyncio
+    async def test_large_dict_payload_caps_entities(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        payload = {f"field{i}": i for i in range(100)}
+
+        result = await pipeline.process(_make_signal(modality=Modality.SENSOR, payload=payload))
+
+        assert result.features.entities == [f"field{i}" for i in range(32)]
+        assert result.features.summary == "sensor.input signal with 100 fields"
+
     @pytest.mark.asyncio
     async def test_upsert_called_with_correct_collection(self) -> None:
         vs = _make_mock_vs()
@@ -143,6 +156,19 @@ class TestPerceptionPipeline:
         item = request.items[0]
         assert item.importance_score == pytest.approx(0.8)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("priority", range(11))
+    async def test_every_priority_maps_to_tenth(self, priority: int) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        await pipeline.process(
+            _make_signal(modality=Modality.SENSOR, payload={}, priority=priority)
+        )
+
+        item = vs.upsert.call_args[0][0].items[0]
+        assert item.importance_score == priority / 10.0
+
     @pytest.mark.asyncio
     async def test_audio_signal_does_not_call_llm(self) -> None:
         vs = _make_mock_vs()
@@ -250,3 +276,407 @@ class TestPerceptionPipeline:
             result = await pipeline.process(signal)
 
         assert result.signal_id == signal.id
+
+
+class TestPerceptionPipelineBatch:
+    @pytest.mark.asyncio
+    async def test_batch_results_align_with_inputs(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        signals = [
+            _make_signal(),
+            _make_signal(modality=Modality.IMAGE, payload=b"\x89PNG\r\n"),
+            _make_signal(modality=Modality.SENSOR, payload={"temperature": 21.0}),
+        ]
+
+        content = (
+            '{"entities": ["fox"], "intent": "statement", "summary": "A fox.", "language": "en"}'
+        )
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = content
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ) as mock_llm:
+            results = await pipeline.process_batch(signals)
+
+        assert [r.signal_id for r in results] == [s.id for s in signals]
+        assert results[0].features.entities == ["fox"]
+        assert results[1].features.modality == "image"
+        assert results[2].features.entities == ["temperature"]
+        assert mock_llm.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_interleaved_text_features_stay_in_order(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        signals = [
+            _make_signal(payload="first"),
+            _make_signal(modality=Modality.SENSOR, payload={"k": 1}),
+            _make_signal(payload="second"),
+        ]
+
+        def _respond(**kwargs: Any) -> MagicMock:
+            word = "first" if "first" in kwargs["messages"][0]["content"] else "second"
+            response = MagicMock()
+            response.choices[0].message.content = f'{{"entities": ["{word}"], "summary": "{word}"}}'
+            return response
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(side_effect=_respond),
+        ):
+            results = await pipeline.process_batch(signals)
+
+        assert results[0].features.entities == ["first"]
+        assert results[1].features.entities == ["k"]
+        assert results[2].features.entities == ["second"]
+
+    @pytest.mark.asyncio
+    async def test_batch_malformed_llm_field_does_not_drop_batch(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        signals = [
+            _make_signal(payload="good one"),
+            _make_signal(payload="bad one"),
+            _make_signal(payload="good two"),
+        ]
+
+        def _respond(**kwargs: Any) -> MagicMock:
+            response = MagicMock()
+            if "bad one" in kwargs["messages"][0]["content"]:
+                response.choices[0].message.content = '{"entities": ["bad"], "intent": ["x"]}'
+            else:
+                response.choices[0].message.content = '{"entities": ["ok"], "intent": "statement"}'
+            return response
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(side_effect=_respond),
+        ):
+            results = await pipeline.process_batch(signals)
+
+        assert [r.signal_id for r in results] == [s.id for s in signals]
+        assert results[0].features.intent == "statement"
+        assert results[1].features.entities == ["bad"]
+        assert results[1].features.intent is None
+        assert results[2].features.intent == "statement"
+        vs.upsert.assert_awaited_once()
+        assert len(vs.upsert.call_args.args[0].items) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_upsert(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        signals = [_make_signal(modality=Modality.SENSOR, payload={"k": i}) for i in range(4)]
+
+        results = await pipeline.process_batch(signals)
+
+        vs.upsert.assert_awaited_once()
+        request = vs.upsert.call_args[0][0]
+        assert request.collection_name == "brain.perception"
+        assert [item.id for item in request.items] == [r.embedding_id for r in results]
+
+    @pytest.mark.asyncio
+    async def test_batch_bounds_concurrent_llm_calls(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs, llm_concurrency=2)
+        signals = [_make_signal(payload=f"text {i}") for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def _respond(**kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            response = MagicMock()
+            response.choices[0].message.content = "{}"
+            return response
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(side_effect=_respond),
+        ) as mock_llm:
+            await pipeline.process_batch(signals)
+
+        assert mock_llm.await_count == 6
+        assert peak == 2
+
+    def test_pipeline_reused_across_event_loops(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs, llm_concurrency=1)
+
+        async def _respond(**kwargs: Any) -> MagicMock:
+            await asyncio.sleep(0)
+            response = MagicMock()
+            response.choices[0].message.content = '{"intent": "statement"}'
+            return response
+
+        async def _run(prefix: str) -> list[PerceptionResult]:
+            # Two texts against a limit of 1, so the second call waits on the
+            # semaphore inside this loop.
+            signals = [_make_signal(payload=f"{prefix} {i}") for i in range(2)]
+            return await pipeline.process_batch(signals)
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(side_effect=_respond),
+        ):
+            first = asyncio.run(_run("first"))
+            second = asyncio.run(_run("second"))
+
+        assert [r.features.intent for r in first + second] == ["statement"] * 4
+
+    def test_invalid_llm_concurrency_raises(self) -> None:
+        with pytest.raises(ValueError):
+            PerceptionPipeline(vector_store=_make_mock_vs(), llm_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_upsert(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        assert await pipeline.process_batch([]) == []
+        vs.upsert.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_records_share_created_at(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        signals = [_make_signal(modality=Modality.SENSOR, payload={"k": i}) for i in range(3)]
+
+        await pipeline.process_batch(signals)
+
+        items = vs.upsert.call_args[0][0].items
+        assert len({item.created_at for item in items}) == 1
+
+
+class TestLLMResponseParsing:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '```json\n{"entities": ["fox"], "intent": "statement", "summary": "A fox.", "language": "en"}\n```',
+            'Here is the JSON:\n{"entities": ["fox"], "intent": "statement", "summary": "A fox.", "language": "en"}\nDone.',
+        ],
+    )
+    async def test_json_wrapped_in_prose_or_fences_is_parsed(self, content: str) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = content
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ):
+            result = await pipeline.process(_make_signal())
+
+        assert result.features.entities == ["fox"]
+        assert result.features.intent == "statement"
+
+    @pytest.mark.asyncio
+    async def test_response_without_json_object_degrades(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = "I cannot help with that."
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ):
+            result = await pipeline.process(_make_signal())
+
+        assert result.features.entities == []
+        assert result.features.intent is None
+
+    @pytest.mark.asyncio
+    async def test_entities_are_capped_deduplicated_and_truncated(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        entities = ["fox", "fox", 42, "", "x" * 100] + [f"e{i}" for i in range(20)]
+
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = json.dumps({"entities": entities})
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ):
+            result = await pipeline.process(_make_signal())
+
+        assert result.features.entities == ["fox", "x" * 64] + [f"e{i}" for i in range(8)]
+
+    @pytest.mark.asyncio
+    async def test_non_list_entities_are_dropped(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = '{"entities": "fox", "intent": "statement"}'
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ):
+            result = await pipeline.process(_make_signal())
+
+        assert result.features.entities == []
+        assert result.features.intent == "statement"
+
+    @pytest.mark.asyncio
+    async def test_non_string_scalar_fields_are_dropped(self) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = json.dumps(
+            {"entities": ["fox"], "intent": ["x"], "summary": {"a": 1}, "language": 7}
+        )
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ):
+            result = await pipeline.process(_make_signal())
+
+        assert result.features.entities == ["fox"]
+        assert result.features.intent is None
+        assert result.features.summary is None
+        assert result.features.language is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [(12345, "12345"), ("x" * 2500, "x" * 2000)],
+    )
+    async def test_prompt_content_from_payload(self, payload: Any, expected: str) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = "{}"
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ) as mock_llm:
+            await pipeline.process(_make_signal(payload=payload))
+
+        prompt = mock_llm.call_args.kwargs["messages"][0]["content"]
+        assert prompt.endswith(f"Signal content: {expected}\n")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload", [None, "", "  ok  ", "\n\t"])
+    async def test_trivially_short_text_skips_llm(self, payload: Any) -> None:
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion", new=AsyncMock()
+        ) as mock_llm:
+            result = await pipeline.process(_make_signal(payload=payload))
+
+        mock_llm.assert_not_awaited()
+        assert result.features.entities == []
+        assert result.features.intent is None
+        vs.upsert.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_prompt_matches_template(self) -> None:
+        from endogenai_perception.pipeline import _FEATURE_EXTRACTION_PROMPT
+
+        vs = _make_mock_vs()
+        pipeline = PerceptionPipeline(vector_store=vs)
+        signal = _make_signal(payload="Hello {there}")
+
+        llm_response = MagicMock()
+        llm_response.choices[0].message.content = "{}"
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=llm_response),
+        ) as mock_llm:
+            await pipeline.process(signal)
+
+        prompt = mock_llm.call_args.kwargs["messages"][0]["content"]
+        assert prompt == _FEATURE_EXTRACTION_PROMPT.format(modality="text", content="Hello {there}")
+
+
+class TestTextFeatureCache:
+    @staticmethod
+    def _llm_response() -> MagicMock:
+        content = (
+            '{"entities": ["fox"], "intent": "statement", "summary": "A fox.", "language": "en"}'
+        )
+        response = MagicMock()
+        response.choices[0].message.content = content
+        return response
+
+    @pytest.mark.asyncio
+    async def test_repeated_content_skips_llm(self) -> None:
+        pipeline = PerceptionPipeline(vector_store=_make_mock_vs())
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=self._llm_response()),
+        ) as mock_llm:
+            first = await pipeline.process(_make_signal())
+            second = await pipeline.process(_make_signal())
+
+        assert mock_llm.await_count == 1
+        assert second.features.entities == first.features.entities == ["fox"]
+        assert second.features.intent == "statement"
+        assert second.signal_id != first.signal_id
+
+    @pytest.mark.asyncio
+    async def test_failed_extraction_is_not_cached(self) -> None:
+        pipeline = PerceptionPipeline(vector_store=_make_mock_vs())
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(side_effect=[Exception("LLM unavailable"), self._llm_response()]),
+        ) as mock_llm:
+            failed = await pipeline.process(_make_signal())
+            recovered = await pipeline.process(_make_signal())
+
+        assert mock_llm.await_count == 2
+        assert failed.features.entities == []
+        assert recovered.features.entities == ["fox"]
+
+    @pytest.mark.asyncio
+    async def test_oldest_entry_is_evicted(self) -> None:
+        pipeline = PerceptionPipeline(vector_store=_make_mock_vs(), text_cache_size=1)
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=self._llm_response()),
+        ) as mock_llm:
+            await pipeline.process(_make_signal(payload="one"))
+            await pipeline.process(_make_signal(payload="two"))
+            await pipeline.process(_make_signal(payload="one"))
+
+        assert mock_llm.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_zero_size_disables_cache(self) -> None:
+        pipeline = PerceptionPipeline(vector_store=_make_mock_vs(), text_cache_size=0)
+
+        with patch(
+            "endogenai_perception.pipeline.litellm.acompletion",
+            new=AsyncMock(return_value=self._llm_response()),
+        ) as mock_llm:
+            await pipeline.process(_make_signal())
+            await pipeline.process(_make_signal())
+
+        assert mock_llm.await_count == 2
+
+    def test_negative_size_raises(self) -> None:
+        with pytest.raises(ValueError):
+            PerceptionPipeline(vector_store=_make_mock_vs(), text_cache_size=-1)
@@ -11,12 +11,13 @@ Usage
 >>> ingestor = SignalIngestor(module_id="sensory-input", instance_id="node-0")
 >>> signal = ingestor.ingest(RawInput(modality=Modality.TEXT, payload="Hello"))
 >>> print(signal.id, signal.timestamp)
+>>> signals = ingestor.ingest_batch([raw_a, raw_b])
 """
 
 from __future__ import annotations
 
-import uuid
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 import structlog
 
@@ -28,6 +29,9 @@ from endogenai_sensory_input.models import (
 )
 from endogenai_sensory_input.normalize import normalize_payload
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 log = structlog.get_logger(__name__)
 
 # Mapping from modality to canonical signal type prefix
@@ -55,15 +59,30 @@ class SignalIngestor:
         Canonical module identifier (default: ``"sensory-input"``).
     instance_id:
         Optional instance tag for multi-instance deployments.
+    log_sample_rate:
+        Emit the per-signal ``signal_ingested`` event for one in every
+        ``log_sample_rate`` ingested signals.  ``1`` (the default) logs every
+        signal.
     """
 
     def __init__(
         self,
         module_id: str = "sensory-input",
         instance_id: str | None = None,
+        log_sample_rate: int = 1,
     ) -> None:
+        if log_sample_rate < 1:
+            raise ValueError(f"log_sample_rate must be >= 1, got {log_sample_rate}")
+        self._log_sample_rate = log_sample_rate
+        self._ingested = 0
         self._module_id = module_id
         self._instance_id = instance_id
+        # Identical for every signal this ingestor emits, so built once.
+        self._source = SignalSource(
+            module_id=module_id,
+            layer="sensory-input",
+            instance_id=instance_id,
+        )
         self._logger = log.bind(module_id=module_id, instance_id=instance_id)
 
     def ingest(self, raw: RawInput) -> Signal:
@@ -72,7 +91,7 @@ class SignalIngestor:
 
         Steps
         -----
-        1. Generate a UUID v4 signal identifier.
+        1. Generate a UUID v4 signal identifier (the Signal id default).
         2. Record the ingestion timestamp.
         3. Normalise the payload (encoding conversion, type coercion).
         4. Wrap everything into a Signal model.
@@ -88,9 +107,35 @@ class SignalIngestor:
         Signal
             The normalised signal envelope.
         """
+        return self._build(raw, datetime.now(tz=UTC))
+
+    def ingest_batch(self, raws: Sequence[RawInput]) -> list[Signal]:
+        """
+        Ingest a batch of raw inputs against a single ingestion timestamp.
+
+        Equivalent to calling :meth:`ingest` for each input, except the clock
+        is read once for the whole batch, so every signal in the batch shares
+        the same ``timestamp`` / ``ingested_at``.
+
+        Parameters
+        ----------
+        raws:
+            The raw inputs to ingest.
+
+        Returns
+        -------
+        list[Signal]
+            One signal per input, in input order.
+        """
         now = datetime.now(tz=UTC)
-        signal_id = str(uuid.uuid4())
+        return [self._build(raw, now) for raw in raws]
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
 
+    def _build(self, raw: RawInput, now: datetime) -> Signal:
+        """Normalise ``raw`` and wrap it in a Signal stamped with ``now``."""
         normalised_payload = normalize_payload(raw.modality, raw.payload, raw.encoding)
 
         # Infer encoding for binary IMAGE/AUDIO payloads that were base64-encoded,
@@ -104,14 +149,9 @@ class SignalIngestor:
             inferred_encoding = "base64"
 
         signal = Signal(
-            id=signal_id,
-            type=_MODALITY_TYPE_PREFIX.get(raw.modality, f"{raw.modality.value}.input"),
+            type=_MODALITY_TYPE_PREFIX.get(raw.modality, f"{raw.modality}.input"),
             modality=raw.modality,
-            source=SignalSource(
-                module_id=self._module_id,
-                layer="sensory-input",
-                instance_id=self._instance_id,
-            ),
+            source=self._source,
             timestamp=now,
             ingested_at=now,
             payload=normalised_payload,
@@ -121,10 +161,12 @@ class SignalIngestor:
             metadata=raw.metadata,
         )
 
-        self._logger.info(
-            "signal_ingested",
-            signal_id=signal_id,
-            modality=raw.modality.value,
-            signal_type=signal.type,
-        )
+        self._ingested += 1
+        if self._ingested % self._log_sample_rate == 0:
+            self._logger.info(
+                "signal_ingested",
+                signal_id=signal.id,
+                modality=raw.modality,
+                signal_type=signal.type,
+            )
         return signal
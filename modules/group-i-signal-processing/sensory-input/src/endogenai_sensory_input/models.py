@@ -6,7 +6,7 @@ All models mirror the constraints defined in shared/types/signal.schema.json.
 
 from __future__ import annotations
 
-import uuid
+import os
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
@@ -14,6 +14,21 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
+def _uuid4_str() -> str:
+    """
+    Return a random RFC 4122 version-4 UUID in canonical string form.
+
+    Equivalent to ``str(uuid.uuid4())`` but formats the random bytes directly
+    instead of building and then stringifying a ``uuid.UUID`` object, which
+    roughly halves the cost of the per-signal id.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class Modality(StrEnum):
     """Primary sensory or data modality of a signal."""
 
@@ -33,7 +48,8 @@ class SignalSource(BaseModel):
     layer: str
     instance_id: str | None = Field(default=None, alias="instanceId")
 
-    model_config = {"populate_by_name": True}
+    # Immutable: SignalIngestor shares one instance across every signal it emits.
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class TraceContext(BaseModel):
@@ -52,7 +68,7 @@ class Signal(BaseModel):
     forwarded upstream.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_uuid4_str)
     type: str
     modality: Modality
     source: SignalSource
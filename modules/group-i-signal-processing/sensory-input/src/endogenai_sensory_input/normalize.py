@@ -9,10 +9,13 @@ ensures payloads are in a consistent, safe format before forwarding.
 from __future__ import annotations
 
 import base64
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from endogenai_sensory_input.models import Modality
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def normalize_payload(modality: Modality, payload: Any, encoding: str | None) -> Any:
     """
@@ -43,24 +46,40 @@ def normalize_payload(modality: Modality, payload: Any, encoding: str | None) ->
     Any
         The normalised payload.
     """
-    match modality:
-        case Modality.TEXT:
-            return str(payload).strip()
-
-        case Modality.IMAGE | Modality.AUDIO:
-            if isinstance(payload, (bytes, bytearray)):
-                return base64.b64encode(payload).decode("ascii")
-            return payload
-
-        case Modality.SENSOR:
-            if isinstance(payload, dict):
-                return payload
-            return {"value": payload}
-
-        case Modality.API_EVENT:
-            if isinstance(payload, dict):
-                return payload
-            return {"value": payload}
-
-        case _:
-            return payload
+    return _NORMALIZERS.get(modality, _passthrough)(payload, encoding)
+
+
+# ---------------------------------------------------------------------------
+# Per-modality normalisers
+# ---------------------------------------------------------------------------
+
+
+def _norm_text(payload: Any, encoding: str | None) -> str:
+    return str(payload).strip()
+
+
+def _norm_binary(payload: Any, encoding: str | None) -> Any:
+    if isinstance(payload, (bytes, bytearray)):
+        return base64.b64encode(payload).decode("ascii")
+    return payload
+
+
+def _norm_mapping(payload: Any, encoding: str | None) -> Any:
+    if isinstance(payload, dict):
+        return payload
+    return {"value": payload}
+
+
+def _passthrough(payload: Any, encoding: str | None) -> Any:
+    return payload
+
+
+# Dispatch table built once at import: one dict lookup per call instead of a
+# chain of enum comparisons.  Modalities not listed are passed through.
+_NORMALIZERS: dict[Modality, Callable[[Any, str | None], Any]] = {
+    Modality.TEXT: _norm_text,
+    Modality.IMAGE: _norm_binary,
+    Modality.AUDIO: _norm_binary,
+    Modality.SENSOR: _norm_mapping,
+    Modality.API_EVENT: _norm_mapping,
+}
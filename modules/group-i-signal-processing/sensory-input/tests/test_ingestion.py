@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
+
 from endogenai_sensory_input.ingestion import SignalIngestor
 from endogenai_sensory_input.models import Modality, RawInput, Signal
 
@@ -184,6 +188,12 @@ class TestSignalIngestorExtras:
         assert signal.source.module_id == "edge-sensor"
         assert signal.source.instance_id == "node-7"
 
+    def test_source_shared_across_signals(self) -> None:
+        ingestor = SignalIngestor(instance_id="node-1")
+        first = ingestor.ingest(RawInput(modality=Modality.TEXT, payload="a"))
+        second = ingestor.ingest(RawInput(modality=Modality.SENSOR, payload={}))
+        assert first.source is second.source
+
     def test_timestamp_equals_ingested_at_for_raw_ingestion(self) -> None:
         ingestor = SignalIngestor()
         signal = ingestor.ingest(RawInput(modality=Modality.TEXT, payload="x"))
@@ -197,3 +207,55 @@ class TestSignalIngestorExtras:
             payload: object = "x" if modality == Modality.TEXT else b"x" if modality in (Modality.IMAGE, Modality.AUDIO) else {}
             signal = ingestor.ingest(RawInput(modality=modality, payload=payload))
             assert signal.modality == modality
+
+
+class TestSignalIngestorBatch:
+    """Unit tests for SignalIngestor.ingest_batch()."""
+
+    def test_batch_preserves_order_and_normalises(self) -> None:
+        ingestor = make_ingestor()
+        raws = [
+            RawInput(modality=Modality.TEXT, payload="  a  "),
+            RawInput(modality=Modality.SENSOR, payload=1.5),
+            RawInput(modality=Modality.IMAGE, payload=b"\x89PNG"),
+        ]
+        signals = ingestor.ingest_batch(raws)
+        assert [s.type for s in signals] == ["text.input", "sensor.reading", "image.frame"]
+        assert signals[0].payload == "a"
+        assert signals[1].payload == {"value": 1.5}
+        assert signals[2].encoding == "base64"
+
+    def test_batch_shares_one_timestamp(self) -> None:
+        ingestor = make_ingestor()
+        raws = [RawInput(modality=Modality.TEXT, payload=str(i)) for i in range(5)]
+        signals = ingestor.ingest_batch(raws)
+        assert len({s.timestamp for s in signals}) == 1
+        assert all(s.ingested_at == s.timestamp for s in signals)
+        assert len({s.id for s in signals}) == 5
+
+    def test_empty_batch(self) -> None:
+        assert make_ingestor().ingest_batch([]) == []
+
+
+class TestSignalIngestorLogSampling:
+    """Per-signal log sampling via log_sample_rate."""
+
+    def test_invalid_log_sample_rate_raises(self) -> None:
+        with pytest.raises(ValueError):
+            SignalIngestor(log_sample_rate=0)
+
+    def test_log_sample_rate_limits_ingest_events(self) -> None:
+        ingestor = SignalIngestor(log_sample_rate=3)
+        with patch.object(ingestor, "_logger") as logger:
+            signals = [
+                ingestor.ingest(RawInput(modality=Modality.TEXT, payload="x")) for _ in range(7)
+            ]
+        assert len(signals) == 7
+        assert logger.info.call_count == 2
+
+    def test_default_logs_every_signal(self) -> None:
+        ingestor = SignalIngestor()
+        with patch.object(ingestor, "_logger") as logger:
+            for _ in range(3):
+                ingestor.ingest(RawInput(modality=Modality.TEXT, payload="x"))
+        assert logger.info.call_count == 3
@@ -56,6 +56,15 @@ class TestSignalSource:
         src = SignalSource(moduleId="m", layer="sensory-input")
         assert src.layer == "sensory-input"
 
+    def test_source_is_immutable(self) -> None:
+        src = SignalSource(moduleId="m", layer="sensory-input")
+        with pytest.raises(ValidationError):
+            src.layer = "perception"  # type: ignore[misc]
+
+    def test_unknown_field_ignored(self) -> None:
+        src = SignalSource(moduleId="m", layer="l", region="x")  # type: ignore[call-arg]
+        assert not hasattr(src, "region")
+
 
 class TestRawInput:
     def test_default_priority_is_5(self) -> None:
@@ -114,6 +123,14 @@ class TestSignal:
         signal = self._make()
         uuid.UUID(signal.id)  # raises ValueError if invalid
 
+    def test_auto_id_is_canonical_uuid4(self) -> None:
+        for _ in range(100):
+            signal_id = self._make().id
+            parsed = uuid.UUID(signal_id)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == signal_id
+
     def test_two_signals_have_different_ids(self) -> None:
         assert self._make().id != self._make().id
 